@@ -4,25 +4,38 @@ Audit Report MVP
 - Hardcoded assessment data
 - 3 radar charts (Operations / Users / Devices)
 - PDF output with ReportLab
+- Optional --batch mode: one report per client JSON, rendered in parallel
 """
 
 from __future__ import annotations
 
+import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
+import hashlib
 import json
 import re
+from xml.sax.saxutils import escape
 from datetime import date
+from pathlib import Path
 from typing import Dict, List, Tuple
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph, Table, TableStyle
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts UTF-8 bytes
+    _json_loads = json.loads
 
 
 # ----------------------------
@@ -45,6 +58,11 @@ PAGE = {
 
 OUTPUT_PDF = "audit-report-mvp.pdf"
 CHART_DIR = "charts"
+# Radars are drawn as vectors in the PDF; standalone copies are optional artifacts.
+EXPORT_CHARTS = False
+CHART_FORMAT = "png"  # or "pdf" / "svg" for vector copies (no raster encode)
+# PNGs are only viewed standalone, so 100 dpi is plenty
+CHART_DPI = 100
 OUTPUT_ROOT = "output"
 # Use sample by default; can point to client_data.json when available
 DATA_FILE = os.path.join("data", "client_data.sample.json")
@@ -119,11 +137,11 @@ DEFAULT_FINDINGS: List[Tuple[str, str]] = [
     ),
 ]
 
-def load_client_data(path: str) -> Tuple[str, Dict[str, Dict[str, int]], List[Tuple[str, str]]]:
+def load_client_data(path: str | Path) -> Tuple[str, Dict[str, Dict[str, int]], List[Tuple[str, str]]]:
     """Load client name, assessment, and findings from JSON if available; otherwise use defaults."""
     if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
         client_name = data.get("client_name", "Client (Sample)")
         assessment = data.get("assessment", DEFAULT_ASSESSMENT)
         findings_raw = data.get("findings", [])
@@ -136,59 +154,172 @@ def load_client_data(path: str) -> Tuple[str, Dict[str, Dict[str, int]], List[Tu
 # ----------------------------
 # Helpers
 # ----------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)  # ndarray fields: compare and hash by identity
 class RadarData:
     title: str
-    labels: List[str]
-    values: List[float]
+    labels: Tuple[str, ...]
+    values: np.ndarray  # float32, index-aligned with labels
     max_value: float = 5.0
 
 
-def ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+@dataclass(frozen=True, eq=False)  # ndarray fields: compare and hash by identity
+class AssessmentScores:
+    """Canonical assessment as parallel arrays (structure-of-arrays).
+
+    Row i of ``scores`` holds the scores for ``categories[i]``, index-aligned with
+    ``subcategories[i]``; categories have different subcategory counts, so rows are
+    zero-padded to the widest one and ``mask`` marks the real entries.
+    """
+
+    categories: Tuple[str, ...]
+    subcategories: Tuple[Tuple[str, ...], ...]
+    scores: np.ndarray  # float32, shape (n_cats, max_subcats)
+    mask: np.ndarray  # bool, same shape
+
+    @classmethod
+    def from_rows(
+        cls, categories: List[str], subcategories: List[List[str]], rows: List[List[float]]
+    ) -> "AssessmentScores":
+        width = max((len(r) for r in rows), default=0)
+        scores = np.zeros((len(rows), width), dtype=np.float32)
+        mask = np.zeros((len(rows), width), dtype=np.bool_)
+        for i, row in enumerate(rows):
+            scores[i, : len(row)] = row
+            mask[i, : len(row)] = True
+        return cls(tuple(categories), tuple(tuple(s) for s in subcategories), scores, mask)
+
+    def row(self, i: int) -> np.ndarray:
+        """Scores for category i without the padding (a view, not a copy)."""
+        return self.scores[i, : len(self.subcategories[i])]
+
+
+# Runs of non-alphanumerics; shared by slugify() and the subcategory matcher
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
 
 def slugify(name: str) -> str:
-    s = name.lower().strip()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    return s.strip("-")
+    return _NON_ALNUM_RE.sub("-", name.lower().strip()).strip("-")
+
+
+def _summarize_scores(scores: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Mean of the valid (masked) entries in each row.
+
+    Written as whole-array reductions: a handful of vectorized NumPy passes however many
+    categories there are.
+    """
+    counts = mask.sum(axis=1)
+    sums = np.where(mask, scores, 0).astype(np.float64).sum(axis=1)
+    return sums / np.maximum(counts, 1)
+
+
+def _summarize(assessment: AssessmentScores) -> Tuple[Dict[str, float], float]:
+    """Return per-category mean scores and the overall mean of those means, rounded to 2 places.
+
+    The overall score averages the rounded category scores, and the maturity labels are
+    taken from these same rounded values, so a printed score always matches its label.
+    """
+    per_cat = _summarize_scores(assessment.scores, assessment.mask)
+    per_cat_scores = {k: round(float(v), 2) for k, v in zip(assessment.categories, per_cat)}
+    overall = round(sum(per_cat_scores.values()) / max(len(per_cat_scores), 1), 2)
+    return per_cat_scores, overall
+
+
+# Lower bounds for Basic / Developing / Managed / Optimized
+MATURITY_THRESHOLDS = np.array([1.25, 2.25, 3.25, 4.25])
+MATURITY_LABELS = ("At Risk", "Basic", "Developing", "Managed", "Optimized")
+
+
+def _maturity_buckets(scores: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Index into MATURITY_LABELS for every score, with no per-score branching.
+
+    searchsorted sorts NaN past every threshold; send it to "At Risk" instead, as a NaN
+    score fails every >= comparison.
+    """
+    buckets = np.searchsorted(thresholds, scores, side="right")
+    return np.where(np.isnan(scores), 0, buckets).astype(np.uint8)
+
+
+def maturity_labels(scores: List[float]) -> List[str]:
+    buckets = _maturity_buckets(np.asarray(scores, dtype=np.float64), MATURITY_THRESHOLDS)
+    return [MATURITY_LABELS[b] for b in buckets]
+
+
+def build_radar(category: str, labels: Tuple[str, ...], values: np.ndarray) -> RadarData:
+    return RadarData(
+        title=category,
+        labels=tuple(labels),
+        values=np.asarray(values, dtype=np.float32),
+        max_value=5.0,
+    )
 
 
-def mean_score(scores: Dict[str, int]) -> float:
-    vals = list(scores.values())
-    return round(sum(vals) / max(len(vals), 1), 2)
+# Radar background bands: 1=red, 3=yellow, 5=green
+RING_EDGES = [0, 1, 2, 3, 4, 5]
+RING_COLORS = [
+    "#CC0000",  # 0-1 (1)
+    "#FF7F00",  # 1-2 (2)
+    "#FFD400",  # 2-3 (3)
+    "#7AC943",  # 3-4 (4)
+    "#00A000",  # 4-5 (5)
+]
+RADAR_LINE_COLOR = colors.HexColor("#1F77B4")  # matplotlib's default "C0" blue
+
+
+# n -> (closed angles, cos, sin); shared read-only, so every radar with n spokes reuses them
+_ANGLE_CACHE: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def _radar_angles(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Axis geometry for n spokes.
+
+    Returns the evenly spaced polar angles with the first repeated at the end (matplotlib's
+    convention), plus the page-space unit vectors of each spoke: first axis at 12 o'clock,
+    running clockwise, as cos/sin arrays of length n.
+    """
+    cached = _ANGLE_CACHE.get(n)
+    if cached is None:
+        theta = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        # Page angle is pi/2 - theta, so its cos/sin are sin/cos of theta
+        cached = (np.append(theta, 0.0), np.sin(theta), np.cos(theta))
+        for arr in cached:
+            arr.flags.writeable = False
+        _ANGLE_CACHE[n] = cached
+    return cached
 
 
-def maturity_label(score_0_to_5: float) -> str:
-    # Simple mapping (tweak later)
-    if score_0_to_5 >= 4.25:
-        return "Optimized"
-    if score_0_to_5 >= 3.25:
-        return "Managed"
-    if score_0_to_5 >= 2.25:
-        return "Developing"
-    if score_0_to_5 >= 1.25:
-        return "Basic"
-    return "At Risk"
+# (figsize, dpi) -> (figure, polar axes), reused by every radar render in this process
+_FIG_CACHE: Dict[Tuple[Tuple[float, float], int], tuple] = {}
 
 
-def build_radar(category: str, subcats: Dict[str, int]) -> RadarData:
-    labels = list(subcats.keys())
-    values = [float(v) for v in subcats.values()]
-    return RadarData(title=category, labels=labels, values=values, max_value=5.0)
+def _radar_axes(figsize: Tuple[float, float] = (6, 6), dpi: int = CHART_DPI) -> tuple:
+    """Return the cached (figure, polar axes) pair for this size, building it on first use."""
+    cached = _FIG_CACHE.get((figsize, dpi))
+    if cached is None:
+        # matplotlib is only needed for the optional exports; import it on first use.
+        # A bare Figure on an Agg canvas never touches pyplot's GUI backends or figure manager.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
 
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111, polar=True)
+        # Fixed margins instead of tight_layout(); the layout is the same for every chart
+        fig.subplots_adjust(left=0.2, right=0.8, top=0.85, bottom=0.15)
+        cached = _FIG_CACHE[(figsize, dpi)] = (fig, ax)
+    return cached
 
-def save_radar_chart_png(radar: RadarData, out_path: str) -> None:
-    # Radar plot via polar axes
-    N = len(radar.labels)
-    angles = np.linspace(0, 2 * np.pi, N, endpoint=False).tolist()
 
-    # Close the loop
-    values = radar.values + radar.values[:1]
-    angles = angles + angles[:1]
+def save_radar_chart(radar: RadarData, out_path: Path) -> None:
+    """Export a standalone copy of the radar; the format follows out_path's extension.
 
-    fig = plt.figure(figsize=(6, 6), dpi=150)
-    ax = plt.subplot(111, polar=True)
+    The PDF report draws its own vector copy, see draw_radar_vector().
+    """
+    # Radar plot via polar axes; angles and values both close the loop
+    angles = _radar_angles(len(radar.labels))[0]
+    values = np.concatenate([radar.values, radar.values[:1]])
+
+    fig, ax = _radar_axes()
+    ax.clear()
 
     ax.set_theta_offset(np.pi / 2)
     ax.set_theta_direction(-1)
@@ -201,32 +332,78 @@ def save_radar_chart_png(radar: RadarData, out_path: str) -> None:
     ax.set_yticks([1, 2, 3, 4, 5])
     ax.set_yticklabels([])
 
-    # Discrete colored rings (1..5): 1=red, 3=yellow, 5=green
-    from matplotlib.colors import ListedColormap, BoundaryNorm
-    theta = np.linspace(0, 2 * np.pi, 360)
-    r_bg = np.linspace(0, radar.max_value, 200)
-    T, R = np.meshgrid(theta, r_bg)
-    Z = R
-    ring_edges = [0, 1, 2, 3, 4, 5]
-    ring_colors = [
-        "#CC0000",  # 0-1 (1)
-        "#FF7F00",  # 1-2 (2)
-        "#FFD400",  # 2-3 (3)
-        "#7AC943",  # 3-4 (4)
-        "#00A000",  # 4-5 (5)
-    ]
-    cmap = ListedColormap(ring_colors)
-    norm = BoundaryNorm(ring_edges, cmap.N)
-    ax.pcolormesh(T, R, Z, cmap=cmap, norm=norm, shading="auto", zorder=0)
-
-    ax.plot(angles, values, linewidth=2, zorder=2)
-    ax.fill(angles, values, alpha=0.15, zorder=1)
+    # Discrete colored rings (1..5): one full-circle bar per ring
+    ax.bar(
+        x=0,
+        height=1,
+        width=2 * np.pi,
+        bottom=RING_EDGES[:-1],
+        color=RING_COLORS,
+        linewidth=0,
+        zorder=0,
+    )
+
+    if len(values):
+        ax.plot(angles, values, linewidth=2, zorder=2)
+        ax.fill(angles, values, alpha=0.15, zorder=1)
 
     ax.set_title(radar.title, fontsize=12, pad=16)
 
-    fig.tight_layout()
-    fig.savefig(out_path, transparent=False)
-    plt.close(fig)
+    save_kwargs = {"pil_kwargs": {"compress_level": 1}} if out_path.suffix == ".png" else {}
+    fig.savefig(out_path, dpi=CHART_DPI, transparent=False, **save_kwargs)
+
+
+# Bump when the chart styling changes so cached exports are re-rendered
+CHART_STYLE_VERSION = 1
+
+
+def chart_cache_key(radar: RadarData) -> str:
+    """Content hash of everything that affects an exported chart's pixels."""
+    payload = f"{radar.title}|{radar.labels}|{radar.values.tolist()}|{radar.max_value}|{CHART_DPI}|v{CHART_STYLE_VERSION}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _render_one(job: Tuple[RadarData, Path]) -> None:
+    """Process-pool entry point: render one (radar, out_path) job."""
+    radar, out_path = job
+    save_radar_chart(radar, out_path)
+
+
+CHART_MANIFEST = "charts.json"
+
+
+def export_charts(radars: Dict[str, RadarData], client_dir: Path, parallel: bool = True) -> Dict[str, Path]:
+    """Write standalone radar charts into client_dir, skipping any whose content is unchanged.
+
+    Files are named by chart_cache_key(); a manifest maps each category to its current
+    file, and superseded exports of the same category are removed.
+    """
+    current: Dict[str, Path] = {}
+    jobs: List[Tuple[RadarData, Path]] = []
+    for category, radar in radars.items():
+        out_chart = client_dir / f"radar_{category.lower()}_{chart_cache_key(radar)}.{CHART_FORMAT}"
+        current[category] = out_chart
+        if not out_chart.exists():
+            jobs.append((radar, out_chart))
+
+    # One worker process per chart that actually needs rendering
+    if jobs and parallel:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as ex:
+            list(ex.map(_render_one, jobs))
+    else:
+        for job in jobs:
+            _render_one(job)
+
+    for category, out_chart in current.items():
+        for stale in client_dir.glob(f"radar_{category.lower()}_*.{CHART_FORMAT}"):
+            if stale != out_chart:
+                stale.unlink()
+        # Reports from before content-hashed names wrote radar_<category>.<fmt>
+        client_dir.joinpath(f"radar_{category.lower()}.{CHART_FORMAT}").unlink(missing_ok=True)
+
+    manifest = {category: path.name for category, path in current.items()}
+    (client_dir / CHART_MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return current
 
 
 # ----------------------------
@@ -261,8 +438,26 @@ ALIASES: Dict[str, Dict[str, str]] = {
 }
 
 
-def parse_canonical_categories(md_path: str) -> Dict[str, List[str]]:
-    """Parse the canonical categories/subcategories from the markdown document."""
+def _norm_key(s: str) -> str:
+    return _NON_ALNUM_RE.sub(" ", s.lower()).strip()
+
+
+# Normalized legacy name -> canonical subcategory, per category
+_ALIAS_INDEX: Dict[str, Dict[str, str]] = {
+    category: {_norm_key(old): new for old, new in alias_map.items()}
+    for category, alias_map in ALIASES.items()
+}
+
+
+_H2_TARGETS = frozenset({"Operations", "Users", "Devices"})
+
+
+@lru_cache(maxsize=4)
+def parse_canonical_categories(md_path: str | Path) -> Dict[str, List[str]]:
+    """Parse the canonical categories/subcategories from the markdown document.
+
+    Cached per path; callers must treat the returned mapping as read-only.
+    """
     categories: Dict[str, List[str]] = {}
     if not os.path.exists(md_path):
         return {k: list(v.keys()) for k, v in DEFAULT_ASSESSMENT.items()}
@@ -270,24 +465,19 @@ def parse_canonical_categories(md_path: str) -> Dict[str, List[str]]:
     current: str | None = None
     try:
         with open(md_path, "r", encoding="utf-8") as f:
-            for raw_line in f:
-                line = raw_line.strip()
-                if line.startswith("## ") and not line.startswith("###"):
-                    h2 = line[3:].strip()
-                    if h2 in ("Operations", "Users", "Devices"):
-                        current = h2
-                        categories[current] = []
-                    else:
-                        current = None
-                elif line.startswith("- ") and current:
-                    item = line[2:].strip()
-                    # Remove trailing double spaces commonly used in markdown for line breaks
-                    item = item.rstrip()
-                    categories[current].append(item)
+            lines = f.read().splitlines()
+        for raw_line in lines:
+            line = raw_line.strip()
+            if line[:3] == "## ":
+                h2 = line[3:].strip()
+                current = h2 if h2 in _H2_TARGETS else None
+                if current:
+                    categories[current] = []
+            elif line[:2] == "- " and current:
+                # strip() above already removed markdown's trailing double-space line breaks
+                categories[current].append(line[2:].strip())
         # Deduplicate while preserving order
-        for k, lst in categories.items():
-            seen = set()
-            categories[k] = [x for x in lst if not (x in seen or seen.add(x))]
+        categories = {k: list(dict.fromkeys(lst)) for k, lst in categories.items()}
     except Exception:
         # Fallback to defaults on any parse error
         return {k: list(v.keys()) for k, v in DEFAULT_ASSESSMENT.items()}
@@ -298,39 +488,40 @@ def canonicalize_assessment(
     assessment_raw: Dict[str, Dict[str, int]],
     canonical: Dict[str, List[str]],
     default_score: int = 2,
-) -> Dict[str, Dict[str, int]]:
+) -> AssessmentScores:
     """Map raw assessment data to canonical subcategories, filling gaps with a default score."""
-    result: Dict[str, Dict[str, int]] = {}
-
-    def norm(s: str) -> str:
-        return re.sub(r"[^a-z0-9]+", " ", s.lower()).strip()
+    categories = ["Operations", "Users", "Devices"]
+    subcategories: List[List[str]] = []
+    rows: List[List[int]] = []
 
-    for category in ("Operations", "Users", "Devices"):
+    for category in categories:
         subcats = canonical.get(category, [])
         raw_cat = assessment_raw.get(category, {})
-        normalized_raw = {norm(k): v for k, v in raw_cat.items()}
-        alias_map = ALIASES.get(category, {})
-
-        mapped: Dict[str, int] = {}
+        alias_index = _ALIAS_INDEX.get(category, {})
+
+        # One pass over the raw scores builds every lookup we need; when several raw keys
+        # normalize alike, the last one wins (as the original dict comprehension did)
+        aliased: Dict[str, int] = {}
+        normalized_raw: Dict[str, int] = {}
+        for k, v in raw_cat.items():
+            nk = _norm_key(k)
+            normalized_raw[nk] = v
+            target = alias_index.get(nk)
+            if target is not None:
+                aliased[target] = v
+
+        scores: List[int] = []
         for sc in subcats:
-            score = None
-            # Exact match
-            if sc in raw_cat:
-                score = raw_cat[sc]
-            else:
-                # Alias mapping
-                for old, new in alias_map.items():
-                    if new == sc and old in raw_cat:
-                        score = raw_cat[old]
-                        break
-                if score is None:
-                    # Normalized match
-                    ns = norm(sc)
-                    if ns in normalized_raw:
-                        score = normalized_raw[ns]
-            mapped[sc] = int(score if score is not None else default_score)
-        result[category] = mapped
-    return result
+            # Exact match, then alias mapping, then normalized match
+            score = raw_cat.get(sc)
+            if score is None:
+                score = aliased.get(sc)
+            if score is None:
+                score = normalized_raw.get(_norm_key(sc))
+            scores.append(int(score if score is not None else default_score))
+        subcategories.append(list(subcats))
+        rows.append(scores)
+    return AssessmentScores.from_rows(categories, subcategories, rows)
 
 
 # ----------------------------
@@ -352,7 +543,7 @@ def draw_header(c: canvas.Canvas, page_w: float, page_h: float, client_name: str
     c.drawRightString(page_w - margin, page_h - header_h + 0.22 * inch, f"Client: {client_name}")
 
 
-def draw_footer(c: canvas.Canvas, page_w: float, page_h: float, page_num: int) -> None:
+def draw_footer(c: canvas.Canvas, page_w: float, page_h: float, page_num: int, report_date: str) -> None:
     margin = PAGE["margin"]
     footer_h = PAGE["footer_h"]
 
@@ -361,11 +552,11 @@ def draw_footer(c: canvas.Canvas, page_w: float, page_h: float, page_num: int) -
 
     c.setFillColor(BRAND["muted_color"])
     c.setFont("Helvetica", 9)
-    c.drawString(margin, 0.22 * inch, f"{BRAND['report_title']} • {date.today().isoformat()}")
+    c.drawString(margin, 0.22 * inch, f"{BRAND['report_title']} • {report_date}")
     c.drawRightString(page_w - margin, 0.22 * inch, f"Page {page_num}")
 
 
-def draw_title_block(c: canvas.Canvas, page_w: float, page_h: float, y_top: float, client_name: str) -> float:
+def draw_title_block(c: canvas.Canvas, page_w: float, page_h: float, y_top: float, client_name: str, report_date: str) -> float:
     margin = PAGE["margin"]
 
     c.setFillColor(colors.black)
@@ -374,7 +565,7 @@ def draw_title_block(c: canvas.Canvas, page_w: float, page_h: float, y_top: floa
 
     c.setFont("Helvetica", 12)
     c.setFillColor(BRAND["muted_color"])
-    c.drawString(margin, y_top - 0.28 * inch, f"{client_name} • Assessment Date: {date.today().isoformat()}")
+    c.drawString(margin, y_top - 0.28 * inch, f"{client_name} • Assessment Date: {report_date}")
 
     return y_top - 0.6 * inch
 
@@ -386,20 +577,40 @@ def draw_exec_summary(c: canvas.Canvas, page_w: float, y_top: float, overall: fl
     c.setFont("Helvetica-Bold", 12)
     c.drawString(margin, y_top, "Executive Summary")
 
-    c.setFont("Helvetica", 10)
-    c.setFillColor(colors.black)
-
+    # Fill color is still black from the heading; only the font changes
     text = c.beginText(margin, y_top - 0.22 * inch)
+    text.setFont("Helvetica", 10)
     text.setLeading(14)
-    text.textLine(f"Overall maturity score: {overall:.2f} / 5.00 ({maturity_label(overall)})")
+    # Label the overall score and every category in one pass
+    overall_label, *cat_labels = maturity_labels([overall, *per_cat.values()])
+    text.textLine(f"Overall maturity score: {overall:.2f} / 5.00 ({overall_label})")
     text.textLine("Category scores:")
-    for k, v in per_cat.items():
-        text.textLine(f"  • {k}: {v:.2f} / 5.00 ({maturity_label(v)})")
+    for (k, v), label in zip(per_cat.items(), cat_labels):
+        text.textLine(f"  • {k}: {v:.2f} / 5.00 ({label})")
     c.drawText(text)
 
     return y_top - 1.15 * inch
 
 
+# Findings table styling is the same for every report, so build it once per process
+FINDINGS_PAD = 0.12 * inch
+FINDING_STYLE = ParagraphStyle("finding", fontName="Helvetica", fontSize=9, leading=11)
+FINDINGS_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), BRAND["accent_color"]),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 10, 11),
+        ("FONT", (0, 1), (-1, -1), "Helvetica", 9, 11),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.white]),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("LEFTPADDING", (0, 0), (-1, -1), FINDINGS_PAD),
+        ("RIGHTPADDING", (0, 0), (-1, -1), FINDINGS_PAD),
+        ("TOPPADDING", (0, 0), (-1, -1), 4.5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4.5),
+    ]
+)
+
+
 def draw_findings_table(
     c: canvas.Canvas,
     page_w: float,
@@ -407,8 +618,12 @@ def draw_findings_table(
     findings: List[Tuple[str, str]],
 ) -> float:
     margin = PAGE["margin"]
-    row_h = 0.28 * inch
+    pad = FINDINGS_PAD
     table_w = page_w - 2 * margin
+    # Widen the Type column to the longest label (measured, not counted); labels past the
+    # cap wrap like the findings text
+    widest_type = max((stringWidth(ftype, "Helvetica", 9) for ftype, _ in findings), default=0.0)
+    type_w = min(max(1.3 * inch - pad, widest_type + 2 * pad), table_w / 3)
 
     c.setFont("Helvetica-Bold", 12)
     c.setFillColor(colors.black)
@@ -416,41 +631,85 @@ def draw_findings_table(
 
     y = y_top - 0.2 * inch
 
-    # Header row
-    c.setFillColor(BRAND["accent_color"])
-    c.rect(margin, y - row_h, table_w, row_h, stroke=0, fill=1)
-    c.setFillColor(colors.white)
-    c.setFont("Helvetica-Bold", 10)
-    c.drawString(margin + 0.12 * inch, y - 0.2 * inch, "Type")
-    c.drawString(margin + 1.3 * inch, y - 0.2 * inch, "Finding")
-
-    y -= row_h
-
-    c.setFont("Helvetica", 9)
-    for i, (ftype, ftext) in enumerate(findings):
-        # alternating fill
-        if i % 2 == 0:
-            c.setFillColor(colors.whitesmoke)
-            c.rect(margin, y - row_h, table_w, row_h, stroke=0, fill=1)
-
-        c.setFillColor(colors.black)
-        c.drawString(margin + 0.12 * inch, y - 0.2 * inch, ftype)
+    data = [["Type", "Finding"]] + [
+        [Paragraph(escape(ftype), FINDING_STYLE), Paragraph(escape(ftext), FINDING_STYLE)] for ftype, ftext in findings
+    ]
+    tbl = Table(data, colWidths=[type_w, table_w - type_w], style=FINDINGS_TABLE_STYLE)
+
+    # Page break guard (minimal): keep only the rows that fit above the footer
+    avail_h = y - (PAGE["footer_h"] + PAGE["margin"])
+    _, tbl_h = tbl.wrapOn(c, table_w, avail_h)
+    if tbl_h > avail_h:
+        parts = tbl.split(table_w, avail_h)
+        if not parts:
+            return y
+        tbl = parts[0]
+        _, tbl_h = tbl.wrapOn(c, table_w, avail_h)
 
-        # simple wrap (basic MVP)
-        max_chars = 95
-        line = ftext if len(ftext) <= max_chars else (ftext[: max_chars - 3] + "...")
-        c.drawString(margin + 1.3 * inch, y - 0.2 * inch, line)
+    tbl.drawOn(c, margin, y - tbl_h)
+    return y - tbl_h - 0.2 * inch
 
-        y -= row_h
 
-        # Page break guard (minimal)
-        if y < (PAGE["footer_h"] + PAGE["margin"] + 1.2 * inch):
-            return y
+def draw_radar_vector(c: canvas.Canvas, cx: float, cy: float, radius: float, radar: RadarData) -> None:
+    """Draw a radar chart centred on (cx, cy) directly with canvas primitives."""
+    # First axis at 12 o'clock, running clockwise (same as the exported charts)
+    _, cos_a, sin_a = _radar_angles(len(radar.labels))
+    scale = radius / radar.max_value
 
-    return y - 0.2 * inch
+    c.saveState()
 
+    # Discrete colored rings, outermost first so inner rings paint over it
+    c.setStrokeColor(colors.lightgrey)
+    c.setLineWidth(0.5)
+    for k in range(len(RING_COLORS), 0, -1):
+        c.setFillColor(colors.HexColor(RING_COLORS[k - 1]))
+        c.circle(cx, cy, RING_EDGES[k] * scale, stroke=1, fill=1)
 
-def draw_charts_page(c: canvas.Canvas, page_w: float, page_h: float, chart_paths: Dict[str, str]) -> None:
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica-Bold", 10)
+    c.drawCentredString(cx, cy + radius + 0.3 * inch, radar.title)
+
+    # A category with no subcategories (e.g. its markdown section is missing) is just the rings
+    if len(radar.values) == 0:
+        c.restoreState()
+        return
+
+    # Spokes, emitted as one batch of line segments
+    c.lines([(cx, cy, cx + radius * ca, cy + radius * sa) for ca, sa in zip(cos_a, sin_a)])
+
+    # Score polygon
+    r = np.clip(radar.values, 0.0, radar.max_value) * scale
+    xs, ys = cx + r * cos_a, cy + r * sin_a
+    path = c.beginPath()
+    path.moveTo(xs[0], ys[0])
+    for x, y in zip(xs[1:], ys[1:]):
+        path.lineTo(x, y)
+    path.close()
+    c.setStrokeColor(RADAR_LINE_COLOR)
+    c.setFillColor(RADAR_LINE_COLOR)
+    c.setFillAlpha(0.15)
+    c.setLineWidth(1.5)
+    c.drawPath(path, stroke=1, fill=1)
+    c.setFillAlpha(1)
+
+    # Axis labels just outside the outer ring, anchored away from the centre
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica", 6.5)
+    label_r = radius * 1.05
+    for ca, sa, label in zip(cos_a, sin_a, radar.labels):
+        x = cx + label_r * ca
+        y = cy + label_r * sa - 2
+        if ca > 0.1:
+            c.drawString(x, y, label)
+        elif ca < -0.1:
+            c.drawRightString(x, y, label)
+        else:
+            c.drawCentredString(x, y + (4 if sa > 0 else -4), label)
+
+    c.restoreState()
+
+
+def draw_charts_page(c: canvas.Canvas, page_w: float, page_h: float, radars: Dict[str, RadarData]) -> None:
     margin = PAGE["margin"]
 
     c.setFont("Helvetica-Bold", 12)
@@ -464,50 +723,68 @@ def draw_charts_page(c: canvas.Canvas, page_w: float, page_h: float, chart_paths
 
     y_top = page_h - PAGE["header_h"] - margin - 0.3 * inch
 
-    for idx, cat in enumerate(["Operations", "Users", "Devices"]):
-        path = chart_paths[cat]
-        img = ImageReader(path)
+    # Leave room above each radar for its title and top label
+    radius = (chart_h - 0.75 * inch) / 2.0
+    cx = margin + chart_w / 2.0
 
-        y = y_top - (idx + 1) * chart_h + 0.15 * inch
-        c.drawImage(img, margin, y, width=chart_w, height=chart_h - 0.25 * inch, preserveAspectRatio=True, anchor="c")
+    for idx, cat in enumerate(["Operations", "Users", "Devices"]):
+        cy = y_top - idx * chart_h - 0.45 * inch - radius
+        draw_radar_vector(c, cx, cy, radius, radars[cat])
 
 
-def generate_pdf(client_name: str, chart_paths: Dict[str, str], assessment: Dict[str, Dict[str, int]], findings: List[Tuple[str, str]], output_pdf_path: str) -> str:
+def draw_report(c: canvas.Canvas, client_name: str, radars: Dict[str, RadarData], assessment: AssessmentScores, findings: List[Tuple[str, str]], report_date: str) -> None:
+    """Draw one client's report pages onto c, ending each page with showPage()."""
     page_w, page_h = PAGE["size"]
-    c = canvas.Canvas(output_pdf_path, pagesize=PAGE["size"])
 
     # Page 1: Summary + Findings
     page_num = 1
     draw_header(c, page_w, page_h, client_name)
 
     y = page_h - PAGE["header_h"] - PAGE["margin"]
-    y = draw_title_block(c, page_w, page_h, y, client_name)
+    y = draw_title_block(c, page_w, page_h, y, client_name, report_date)
 
-    per_cat_scores = {k: mean_score(v) for k, v in assessment.items()}
-    overall = round(sum(per_cat_scores.values()) / 3.0, 2)
+    per_cat_scores, overall = _summarize(assessment)
 
     y = draw_exec_summary(c, page_w, y, overall, per_cat_scores)
     y = draw_findings_table(c, page_w, y, findings)
 
-    draw_footer(c, page_w, page_h, page_num)
+    draw_footer(c, page_w, page_h, page_num, report_date)
     c.showPage()
 
     # Page 2: Charts
     page_num = 2
     draw_header(c, page_w, page_h, client_name)
-    draw_charts_page(c, page_w, page_h, chart_paths)
-    draw_footer(c, page_w, page_h, page_num)
+    draw_charts_page(c, page_w, page_h, radars)
+    draw_footer(c, page_w, page_h, page_num, report_date)
     c.showPage()
 
+
+def generate_pdf(client_name: str, radars: Dict[str, RadarData], assessment: AssessmentScores, findings: List[Tuple[str, str]], output_pdf_path: str | Path, report_date: str | None = None) -> str | Path:
+    # One date for every page of the document
+    report_date = report_date or date.today().isoformat()
+    c = canvas.Canvas(os.fspath(output_pdf_path), pagesize=PAGE["size"])
+    draw_report(c, client_name, radars, assessment, findings, report_date)
     c.save()
     return output_pdf_path
 
 
-def main() -> None:
-    client_name, assessment_raw, findings = load_client_data(DATA_FILE)
+@dataclass(frozen=True)
+class ClientReport:
+    """Everything needed to draw one client's report."""
+
+    client_name: str
+    radars: Dict[str, RadarData]
+    assessment: AssessmentScores
+    findings: List[Tuple[str, str]]
+    client_dir: Path
+
+
+def prepare_client(data_path: str | Path, parallel_charts: bool = True) -> ClientReport:
+    """Load and canonicalize one client's data, creating its output folder and optional chart exports."""
+    client_name, assessment_raw, findings = load_client_data(data_path)
 
     # Parse canonical categories/subcategories from markdown
-    md_path = os.path.join(os.path.dirname(__file__), "aegis-categories-v1.md")
+    md_path = Path(__file__).with_name("aegis-categories-v1.md")
     canonical = parse_canonical_categories(md_path)
 
     # Align assessment to canonical subcategories; fill gaps with default score
@@ -515,23 +792,97 @@ def main() -> None:
 
     # Client-specific output directory
     client_slug = slugify(client_name)
-    client_dir = os.path.join(OUTPUT_ROOT, client_slug)
-    ensure_dir(client_dir)
+    client_dir = Path(OUTPUT_ROOT) / client_slug
+    client_dir.mkdir(parents=True, exist_ok=True)
+
+    radars: Dict[str, RadarData] = {
+        category: build_radar(category, labels, assessment.row(i))
+        for i, (category, labels) in enumerate(zip(assessment.categories, assessment.subcategories))
+    }
+
+    # Optional standalone radar charts in the client folder
+    if EXPORT_CHARTS:
+        export_charts(radars, client_dir, parallel=parallel_charts)
+
+    return ClientReport(client_name, radars, assessment, findings, client_dir)
+
 
-    # Generate radar charts to client folder
-    chart_paths: Dict[str, str] = {}
-    for category, subcats in assessment.items():
-        radar = build_radar(category, subcats)
-        out_png = os.path.join(client_dir, f"radar_{category.lower()}.png")
-        save_radar_chart_png(radar, out_png)
-        chart_paths[category] = out_png
+def render_client(data_path: str | Path, parallel_charts: bool = True, report_date: str | None = None) -> Path:
+    """Build one client's report (and optional chart exports) from its JSON data file."""
+    report = prepare_client(data_path, parallel_charts=parallel_charts)
 
     # Generate PDF to client folder
-    pdf_path = os.path.join(client_dir, OUTPUT_PDF)
-    pdf_path = generate_pdf(client_name, chart_paths, assessment, findings, pdf_path)
-    print(f"Generated: {pdf_path}")
-    print(f"Outputs saved in: {client_dir}/")
+    pdf_path = report.client_dir / OUTPUT_PDF
+    generate_pdf(report.client_name, report.radars, report.assessment, report.findings, pdf_path, report_date=report_date)
+    return pdf_path
+
+
+def render_combined(data_paths: List[str], output_pdf_path: str | Path, report_date: str | None = None) -> Path:
+    """Render every client into one PDF book on a single canvas, in the order given."""
+    report_date = report_date or date.today().isoformat()
+    output_pdf_path = Path(output_pdf_path)
+    output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    c = canvas.Canvas(os.fspath(output_pdf_path), pagesize=PAGE["size"])
+    for data_path in data_paths:
+        # Clients are drawn one after another, so render any chart exports inline too
+        # rather than starting a pool (and re-importing matplotlib) per client
+        report = prepare_client(data_path, parallel_charts=False)
+        draw_report(c, report.client_name, report.radars, report.assessment, report.findings, report_date)
+    c.save()
+    return output_pdf_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=BRAND["report_title"])
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="JSON",
+        help="client data files to render in parallel, one report per file",
+    )
+    parser.add_argument(
+        "--combined",
+        metavar="PDF",
+        help="with --batch, write all clients into this one PDF instead of one report each",
+    )
+    args = parser.parse_args()
+    if args.combined and not args.batch:
+        parser.error("--combined requires --batch")
+    if args.batch:
+        # Only the default DATA_FILE run falls back to the sample client; named files must exist
+        missing = [p for p in args.batch if not Path(p).is_file()]
+        if missing:
+            parser.error(f"client data file(s) not found: {', '.join(missing)}")
+        # Clients whose names slugify alike would write the same output/<slug>/ folder
+        by_slug: Dict[str, List[str]] = {}
+        for p in args.batch:
+            by_slug.setdefault(slugify(load_client_data(p)[0]), []).append(p)
+        clashes = [f"{slug} ({', '.join(paths)})" for slug, paths in by_slug.items() if len(paths) > 1]
+        if clashes:
+            parser.error(f"clients share an output folder: {'; '.join(clashes)}")
+
+    # One date for the whole run, so every report in a batch carries the same date
+    report_date = date.today().isoformat()
+
+    if not args.batch:
+        pdf_path = render_client(DATA_FILE, report_date=report_date)
+        print(f"Generated: {pdf_path}")
+        print(f"Outputs saved in: {pdf_path.parent}/")
+        return
+
+    if args.combined:
+        # A single canvas is drawn serially; each client still gets its chart exports
+        pdf_path = render_combined(args.batch, args.combined, report_date=report_date)
+        print(f"Generated: {pdf_path}")
+        return
+
+    # Clients are independent: one process each. Charts render inline in each worker
+    # rather than spawning a nested pool per client.
+    worker = partial(render_client, parallel_charts=False, report_date=report_date)
+    with ProcessPoolExecutor(max_workers=min(len(args.batch), os.cpu_count() or 1)) as ex:
+        for pdf_path in ex.map(worker, args.batch):
+            print(f"Generated: {pdf_path}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()